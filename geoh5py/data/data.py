@@ -33,9 +33,11 @@ class Data(Entity):
     Base class for Data entities.
     """
 
+    __slots__ = ("_association", "_entity_type", "_modifiable", "_values")
+
     _attribute_map = Entity._attribute_map.copy()
     _attribute_map.update({"Association": "association", "Modifiable": "modifiable"})
-    _visible = False
+    _default_visible = False
 
     def __init__(
         self,
@@ -196,12 +198,12 @@ class Data(Entity):
     @association.setter
     def association(self, value: str | DataAssociationEnum):
         if isinstance(value, str):
-            if value.upper() not in DataAssociationEnum.__members__:
+            try:
+                value = DataAssociationEnum.__members__[value.upper()]
+            except KeyError as error:
                 raise ValueError(
                     f"Association flag should be one of {DataAssociationEnum.__members__}"
-                )
-
-            value = getattr(DataAssociationEnum, value.upper())
+                ) from error
 
         if not isinstance(value, DataAssociationEnum):
             raise TypeError(f"Association must be of type {DataAssociationEnum}")
@@ -229,6 +231,9 @@ class Data(Entity):
 
     @entity_type.setter
     def entity_type(self, data_type: DataType):
+        if getattr(self, "_entity_type", None) is data_type:
+            return
+
         self._entity_type = data_type
         self.workspace.update_attribute(self, "entity_type")
 
@@ -54,13 +54,16 @@ class Group(EntityContainer):
         if not isinstance(children, list):
             children = [children]
 
+        children_uids = {child.uid for child in self._children}
+
         for child in children:
-            if child not in self._children:
-                if not isinstance(child, Entity):
-                    raise TypeError(
-                        f"Child must be an instance of Entity, not {type(child)}"
-                    )
+            if not isinstance(child, Entity):
+                raise TypeError(
+                    f"Child must be an instance of Entity, not {type(child)}"
+                )
+            if child.uid not in children_uids:
                 self._children.append(child)
+                children_uids.add(child.uid)
 
     def add_comment(self, comment: str, author: str | None = None):
         """
@@ -37,6 +37,14 @@ class BlockModel(GridObject):
     are accepted to denote relative offsets from the origin.
     """
 
+    __slots__ = (
+        "_origin",
+        "_rotation",
+        "_u_cell_delimiters",
+        "_v_cell_delimiters",
+        "_z_cell_delimiters",
+    )
+
     __TYPE_UID = uuid.UUID(
         fields=(0xB020A277, 0x90E2, 0x4CD7, 0x84, 0xD6, 0x612EE3F25051)
     )
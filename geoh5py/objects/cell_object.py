@@ -160,8 +160,10 @@ class CellObject(Points, ABC):
             cell_mask: Array of indices to sub-sample the input entity cells.
         """
         if mask is not None and self.vertices is not None:
-            if not isinstance(mask, np.ndarray) or mask.shape != (
-                self.vertices.shape[0],
+            if (
+                not isinstance(mask, np.ndarray)
+                or mask.ndim != 1
+                or mask.shape[0] != self.vertices.shape[0]
             ):
                 raise ValueError("Mask must be an array of shape (n_vertices,).")
 
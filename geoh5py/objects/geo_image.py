@@ -20,7 +20,6 @@ import uuid
 import warnings
 from io import BytesIO
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -40,6 +39,8 @@ from .object_base import ObjectBase, ObjectType
 if TYPE_CHECKING:
     from ..objects import Grid2D
 
+_DEFAULT_CELLS = np.array([[0, 1, 2, 0], [0, 2, 3, 0]], dtype="uint32")
+
 
 class GeoImage(ObjectBase):
     """
@@ -49,6 +50,8 @@ class GeoImage(ObjectBase):
 
     """
 
+    __slots__ = ("_cells", "_image", "_tag", "_vertices")
+
     __TYPE_UID = uuid.UUID(
         fields=(0x77AC043C, 0xFE8D, 0x4D14, 0x81, 0x67, 0x75E300FB835A)
     )
@@ -58,10 +61,31 @@ class GeoImage(ObjectBase):
     def __init__(self, object_type: ObjectType, **kwargs):
         self._vertices: None | np.ndarray = None
         self._cells = None
+        self._image: Image.Image | None = None
         self._tag: dict[int, Any] | None = None
 
         super().__init__(object_type, **kwargs)
 
+    @staticmethod
+    def _encode_image(image: Image.Image, source_bytes: bytes | None) -> bytes:
+        """
+        Encode a PIL image to its storage format.
+
+        When the source bytes are already in the storage format for the
+        image mode, they are returned as-is, skipping both the decode
+        and the re-encode.
+        """
+        if (
+            source_bytes is not None
+            and image.format == PILLOW_ARGUMENTS[image.mode]["format"]
+        ):
+            return source_bytes
+
+        buffer = BytesIO()
+        image.save(buffer, **PILLOW_ARGUMENTS[image.mode])
+
+        return buffer.getvalue()
+
     @property
     def cells(self) -> np.ndarray | None:
         r"""
@@ -73,7 +97,7 @@ class GeoImage(ObjectBase):
             if self.on_file:
                 self._cells = self.workspace.fetch_array_attribute(self)
             else:
-                self.cells = np.c_[[0, 1, 2, 0], [0, 2, 3, 0]].T.astype("uint32")
+                self.cells = _DEFAULT_CELLS.copy()
 
         return self._cells
 
@@ -170,15 +194,13 @@ class GeoImage(ObjectBase):
         """
         Assign the default vertices based on image pixel count
         """
-        if self.image is not None:
-            return np.asarray(
-                [
-                    [0, self.image.size[1], 0],
-                    [self.image.size[0], self.image.size[1], 0],
-                    [self.image.size[0], 0, 0],
-                    [0, 0, 0],
-                ]
-            )
+        image = self.image
+        if image is not None:
+            width, height = image.size
+            vertices = np.zeros((4, 3))
+            vertices[:2, 1] = height
+            vertices[1:3, 0] = width
+            return vertices
         return None
 
     @property
@@ -266,23 +288,16 @@ class GeoImage(ObjectBase):
                 "with the same number of rows as the control points."
             )
         constant = np.ones(reference.shape[0])
-        param_x, _, _, _ = np.linalg.lstsq(
-            np.c_[constant, reference], locations[:, 0], rcond=None
-        )
-        param_y, _, _, _ = np.linalg.lstsq(
-            np.c_[constant, reference], locations[:, 1], rcond=None
-        )
-        param_z, _, _, _ = np.linalg.lstsq(
-            np.c_[constant, reference], locations[:, 2], rcond=None
+
+        # Single least-squares solve with the x, y, z coordinates as
+        # multiple right-hand sides sharing the same design matrix.
+        params, _, _, _ = np.linalg.lstsq(
+            np.c_[constant, reference], locations, rcond=None
         )
 
         corners = self.default_vertices[:, :2]
 
-        self.vertices = np.c_[
-            param_x[0] + corners @ param_x[1:],
-            param_y[0] + corners @ param_y[1:],
-            param_z[0] + corners @ param_z[1:],
-        ]
+        self.vertices = params[0] + corners @ params[1:]
 
         self.set_tag_from_vertices()
 
@@ -337,10 +352,10 @@ class GeoImage(ObjectBase):
         """
         Get the image as a :obj:`PIL.Image` object.
         """
-        if self.image_data is not None:
-            return Image.open(BytesIO(self.image_data.values))
+        if self._image is None and self.image_data is not None:
+            self._image = Image.open(BytesIO(self.image_data.values))
 
-        return None
+        return self._image
 
     @image.setter
     def image(self, image: str | np.ndarray | BytesIO | Image.Image):
@@ -352,6 +367,7 @@ class GeoImage(ObjectBase):
         :return: List of new Data objects.
         """
         convert_to_grid = False
+        source_bytes: bytes | None = None
         # todo: this should be changed in the future to accept tiff images
         if isinstance(image, np.ndarray) and image.ndim in [2, 3]:
             if image.ndim == 3 and image.shape[2] != 3:
@@ -360,11 +376,15 @@ class GeoImage(ObjectBase):
                     "a 3D array with shape(*,*, 3) representing 'RGB' values."
                 )
             value = image
-            if image.min() < 0 or image.max() > 255 or image.dtype != "uint8":
-                value = image.astype(float)
-                value -= value.min()
-                value *= 255.0 / value.max()
-                value = value.astype("uint8")
+            if image.dtype != np.uint8:
+                lo, hi = image.min(), image.max()
+                if hi > lo:
+                    value = np.multiply(
+                        np.subtract(image, lo, dtype=np.float32),
+                        np.float32(255.0) / (float(hi) - float(lo)),
+                    ).astype("uint8")
+                else:
+                    value = np.zeros(image.shape, dtype="uint8")
 
             image = Image.fromarray(value)
 
@@ -372,8 +392,10 @@ class GeoImage(ObjectBase):
             if not Path(image).is_file():
                 raise ValueError(f"Input image file {image} does not exist.")
 
-            image = Image.open(image)
+            source_bytes = Path(image).read_bytes()
+            image = Image.open(BytesIO(source_bytes))
         elif isinstance(image, bytes):
+            source_bytes = image
             image = Image.open(BytesIO(image))
 
         elif not isinstance(image, Image.Image):
@@ -387,22 +409,23 @@ class GeoImage(ObjectBase):
             self.tag = image
             convert_to_grid = True
 
-        with TemporaryDirectory() as tempdir:
-            if image.mode not in PILLOW_ARGUMENTS:
-                raise NotImplementedError(
-                    f"The mode {image.mode} of the image is not supported."
-                )
+        if image.mode not in PILLOW_ARGUMENTS:
+            raise NotImplementedError(
+                f"The mode {image.mode} of the image is not supported."
+            )
 
-            temp_file = Path(tempdir) / "image"
-            image.save(temp_file, **PILLOW_ARGUMENTS[image.mode])
+        values = self._encode_image(image, source_bytes)
 
-            if self.image_data is not None:
-                self.workspace.remove_entity(self.image_data)
+        if self.image_data is not None:
+            self.workspace.remove_entity(self.image_data)
 
-            image = self.add_file(str(temp_file))
+        with self.workspace.defer_writes():
+            image = self.add_file_bytes(values, "image")
             image.name = "GeoImageMesh_Image"
             image.entity_type.name = "GeoImageMesh_Image"
 
+        self._image = None
+
         # quick and dirty fix: create a grid if image is tiff
         if convert_to_grid:
             self.to_grid2d(name=self.name + "_grid2d")
@@ -611,7 +634,7 @@ class GeoImage(ObjectBase):
 
         # todo: change the call from vertices to vertices_xyz in the code
         if self._vertices is not None:
-            return self._vertices.view("<f8").reshape((-1, 3)).astype(float)
+            return self._vertices.view("<f8").reshape((-1, 3))
 
         return self._vertices
 
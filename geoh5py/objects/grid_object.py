@@ -77,7 +77,8 @@ class GridObject(ObjectBase, ABC):
             and self.centroids is not None
             and (
                 not isinstance(mask, np.ndarray)
-                or mask.shape != (self.centroids.shape[0],)
+                or mask.ndim != 1
+                or mask.shape[0] != self.centroids.shape[0]
             )
         ):
             raise ValueError("Mask must be an array of shape (n_vertices,).")
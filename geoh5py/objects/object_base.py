@@ -73,19 +73,21 @@ class ObjectBase(EntityContainer):
         """
         property_groups = self._property_groups or []
 
-        prop_group_uids = {prop_group.uid: prop_group for prop_group in property_groups}
-        children_uids = {child.uid: child for child in self._children}
+        prop_group_uids = {prop_group.uid for prop_group in property_groups}
+        children_uids = {child.uid for child in self._children}
 
         for child in children:
             if child.uid not in children_uids and isinstance(
                 child, (Data, PropertyGroup)
             ):
                 self._children.append(child)
+                children_uids.add(child.uid)
                 if (
                     isinstance(child, PropertyGroup)
                     and child.uid not in prop_group_uids
                 ):
                     property_groups.append(child)
+                    prop_group_uids.add(child.uid)
             else:
                 warnings.warn(f"Child {child} is not valid or already exists.")
 
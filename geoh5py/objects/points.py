@@ -144,8 +144,10 @@ class Points(ObjectBase):
         Sub-class extension of :func:`~geoh5py.shared.entity.Entity.copy`.
         """
         if mask is not None and self.vertices is not None:
-            if not isinstance(mask, np.ndarray) or mask.shape != (
-                self.vertices.shape[0],
+            if (
+                not isinstance(mask, np.ndarray)
+                or mask.ndim != 1
+                or mask.shape[0] != self.vertices.shape[0]
             ):
                 raise ValueError("Mask must be an array of shape (n_vertices,).")
 
@@ -50,14 +50,82 @@ OMIT_LIST = [
     "_base_stations",
     "_tx_id_property",
     "_metadata",
+    "_channels",
+    "_input_type",
+    "_survey_type",
+    "_unit",
 ]
 
 
+# Sentinel distinguishing "looked up and absent" from "not yet looked up"
+# in the tx_id_property cache.
+_TX_ID_ABSENT: Any = object()
+
+
+def _sorted_intersect(values_a: np.ndarray, values_b: np.ndarray) -> np.ndarray:
+    """
+    Sorted unique intersection of two arrays, equivalent to np.intersect1d.
+
+    Only the larger array is sorted, then searched by binary search, which
+    avoids the concatenate-and-sort of np.intersect1d when the inputs
+    differ in size.
+    """
+    if values_a.size > values_b.size:
+        values_a, values_b = values_b, values_a
+
+    values_a = np.unique(values_a)
+    values_b = np.sort(values_b)
+
+    if values_a.size == 0 or values_b.size == 0:
+        return values_a[:0]
+
+    indices = np.searchsorted(values_b, values_a).clip(max=values_b.size - 1)
+
+    return values_a[values_b[indices] == values_a]
+
+
+def _remap_ids(values: np.ndarray, uniques: np.ndarray) -> np.ndarray:
+    """
+    Remap values onto their index within a sorted unique ID array.
+
+    For the usual dense, small ID ranges a flat lookup table turns the
+    remap into a single gather without intermediates; sparse ranges fall
+    back to binary search. Every value must appear in the unique array.
+    """
+    span = int(uniques[-1]) + 1
+    if span <= 4 * max(uniques.size, 1024):
+        table = np.zeros(span, dtype=np.int32)
+        table[uniques] = np.arange(uniques.size, dtype=np.int32)
+        return table[values]
+
+    return np.searchsorted(uniques, values).astype(np.int32, copy=False)
+
+
+def _isin_sorted(sorted_unique: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Membership mask of values within a sorted unique array.
+
+    Equivalent to np.isin(values, sorted_unique) but skips the sort and
+    deduplication np.isin would redo on already prepared inputs.
+    """
+    if sorted_unique.size == 0:
+        return np.zeros(values.shape, dtype=bool)
+
+    indices = np.searchsorted(sorted_unique, values).clip(max=sorted_unique.size - 1)
+
+    return sorted_unique[indices] == values
+
+
 class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
     """
     A base electromagnetics survey object.
     """
 
+    # No instance slots: survey state lives in class-attribute sentinels
+    # overwritten per instance, and the ObjectBase chain keeps a __dict__,
+    # so slotting the survey classes would not drop the per-instance dict.
+    __slots__ = ()
+
     __INPUT_TYPE = None
     __TYPE = None
     __UNITS = None
@@ -65,6 +133,11 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
     _receivers: BaseEMSurvey | None = None
     _transmitters: BaseEMSurvey | None = None
 
+    _channels: list | None = None
+    _input_type: str | None = None
+    _survey_type: str | None = None
+    _unit: float | None = None
+
     def add_components_data(self, data: dict) -> list[PropertyGroup]:
         """
         Add lists of data components to an EM survey. The name of each component is
@@ -120,19 +193,33 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
                 "Input data must be nested dictionaries of components and channels."
             )
 
-        for name, data_block in data.items():
-            prop_group = self.add_validate_component_data(name, data_block)
-            prop_groups.append(prop_group)
+        group_names = {pg.name for pg in self.property_groups or []}
+        with self.workspace.defer_writes():
+            for name, data_block in data.items():
+                prop_group = self.add_validate_component_data(
+                    name, data_block, group_names=group_names
+                )
+                prop_groups.append(prop_group)
+                group_names.add(prop_group.name)
 
         return prop_groups
 
-    def add_validate_component_data(self, name: str, data_block: list | dict):
+    def add_validate_component_data(
+        self, name: str, data_block: list | dict, group_names: set[str] | None = None
+    ):
         """
         Append a property group to the entity and its metadata after validations.
+
+        :param name: Name of the property group to be added.
+        :param data_block: List of existing Data entities or a dictionary of
+            attributes defining new ones.
+        :param group_names: Names of the existing property groups, built from
+            :obj:`~geoh5py.objects.object_base.ObjectBase.property_groups` if None.
         """
-        if self.property_groups is not None and name in [
-            pg.name for pg in self.property_groups
-        ]:
+        if group_names is None:
+            group_names = {pg.name for pg in self.property_groups or []}
+
+        if name in group_names:
             raise ValueError(
                 f"PropertyGroup named '{name}' already exists on the survey entity. "
                 f"Consider using the 'edit_em_metadata' method with "
@@ -157,7 +244,7 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
             )
 
         if isinstance(data_block, list):
-            assert np.all([entry.parent == self for entry in data_block]), (
+            assert all(entry.parent is self for entry in data_block), (
                 f"The list of values provided for the component '{name}' "
                 f"must contain {FloatData} belonging to the target survey."
             )
@@ -165,14 +252,17 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
             data_list = data_block
 
         else:
-            data_list = []
             for channel, attr in data_block.items():
                 if not isinstance(attr, dict):
                     raise TypeError(
                         f"Given value to data {channel} should of type {dict} or attributes. "
                         f"Type {type(attr)} given instead."
                     )
-                data_list.append(self.add_data({channel: attr}))
+
+            data_list = self.add_data(data_block)
+
+            if not isinstance(data_list, list):
+                data_list = [data_list]
 
         prop_group = self.add_data_to_group(data_list, name)
         self.edit_em_metadata({"Property groups": prop_group})
@@ -184,16 +274,22 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         """
         List of measured channels.
         """
-        channels = self.metadata["EM Dataset"]["Channels"]
-        return channels
+        if self._channels is None:
+            self._channels = self.metadata["EM Dataset"]["Channels"]
+
+        return self._channels
 
     @channels.setter
     def channels(self, values: list | np.ndarray):
         if isinstance(values, np.ndarray):
-            values = values.tolist()
-
-        if not isinstance(values, list) or not np.all(
-            [isinstance(x, float) for x in values]
+            if values.dtype.kind != "f":
+                raise TypeError(
+                    f"Values provided as 'channels' must be a list of {float}. "
+                    f"{type(values)} provided"
+                )
+            values = values.astype(np.float64, copy=False).tolist()
+        elif not isinstance(values, list) or not all(
+            isinstance(x, float) for x in values
         ):
             raise TypeError(
                 f"Values provided as 'channels' must be a list of {float}. {type(values)} provided"
@@ -211,9 +307,10 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         """
         Rapid access to the list of data entities for all components.
         """
-        if "Property groups" in self.metadata["EM Dataset"]:
+        em_metadata = self.metadata["EM Dataset"]
+        if "Property groups" in em_metadata:
             components = {}
-            for name in self.metadata["EM Dataset"]["Property groups"]:
+            for name in em_metadata["Property groups"]:
                 prop_group = self.find_or_create_property_group(name=name)
 
                 if prop_group.properties is None:
@@ -252,9 +349,13 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         )
 
         # Copy metadata except reference to entities UUID
-        for key, value in self.metadata["EM Dataset"].items():
-            if not isinstance(value, (uuid.UUID, type(None))):
-                new_entity.edit_em_metadata({key: value})
+        em_metadata = {
+            key: value
+            for key, value in self.metadata["EM Dataset"].items()
+            if not isinstance(value, (uuid.UUID, type(None)))
+        }
+        if em_metadata:
+            new_entity.edit_em_metadata(em_metadata)
 
         if self.complement is not None:
             self.copy_complement(
@@ -369,10 +470,10 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
     @property
     def input_type(self) -> str | None:
         """Data input type. Must be one of 'Rx', 'Tx' or 'Tx and Rx'"""
-        if "Input type" in self.metadata["EM Dataset"]:
-            return self.metadata["EM Dataset"]["Input type"]
+        if self._input_type is None:
+            self._input_type = self.metadata["EM Dataset"].get("Input type")
 
-        return None
+        return self._input_type
 
     @input_type.setter
     def input_type(self, value: str):
@@ -441,12 +542,14 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
                     continue
 
         self._metadata = values
+        self._clear_metadata_caches()
         self.workspace.update_attribute(self, "metadata")
 
         for elem in ["receivers", "transmitters", "base_stations"]:
             dependent = getattr(self, elem, None)
             if dependent is not None and dependent is not self:
                 setattr(dependent, "_metadata", values)
+                dependent._clear_metadata_caches()  # pylint: disable=protected-access
                 self.workspace.update_attribute(dependent, "metadata")
 
     @property
@@ -455,8 +558,12 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         The associated TEM receivers.
         """
         if getattr(self, "_receivers", None) is None:
-            if self.metadata is not None and "Receivers" in self.metadata["EM Dataset"]:
-                receiver = self.metadata["EM Dataset"]["Receivers"]
+            receiver = (
+                self.metadata["EM Dataset"].get("Receivers")
+                if self.metadata is not None
+                else None
+            )
+            if receiver is not None:
                 receiver_entity = self.workspace.get_entity(receiver)[0]
 
                 if isinstance(receiver_entity, BaseEMSurvey):
@@ -477,10 +584,10 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
     @property
     def survey_type(self) -> str | None:
         """Data input type. Must be one of 'Rx', 'Tx' or 'Tx and Rx'"""
-        if "Survey type" in self.metadata["EM Dataset"]:
-            return self.metadata["EM Dataset"]["Survey type"]
+        if self._survey_type is None:
+            self._survey_type = self.metadata["EM Dataset"].get("Survey type")
 
-        return None
+        return self._survey_type
 
     @property
     def transmitters(self):
@@ -488,11 +595,12 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         The associated TEM transmitters (sources).
         """
         if getattr(self, "_transmitters", None) is None:
-            if (
-                self.metadata is not None
-                and "Transmitters" in self.metadata["EM Dataset"]
-            ):
-                transmitter = self.metadata["EM Dataset"]["Transmitters"]
+            transmitter = (
+                self.metadata["EM Dataset"].get("Transmitters")
+                if self.metadata is not None
+                else None
+            )
+            if transmitter is not None:
                 transmitter_entity = self.workspace.get_entity(transmitter)[0]
 
                 if isinstance(transmitter_entity, BaseEMSurvey):
@@ -525,7 +633,10 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         """
         Default channel units for time or frequency defined on the child class.
         """
-        return self.metadata["EM Dataset"].get("Unit")
+        if self._unit is None:
+            self._unit = self.metadata["EM Dataset"].get("Unit")
+
+        return self._unit
 
     @unit.setter
     def unit(self, value: str):
@@ -534,6 +645,15 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
                 raise ValueError(f"Input 'unit' must be one of {self.default_units}")
             self.edit_em_metadata({"Unit": value})
 
+    def _clear_metadata_caches(self):
+        """
+        Reset the values cached from the 'EM Dataset' metadata.
+        """
+        self._channels = None
+        self._input_type = None
+        self._survey_type = None
+        self._unit = None
+
     def _edit_validate_property_groups(
         self, values: PropertyGroup | list[PropertyGroup] | list[str] | None
     ):
@@ -542,8 +662,10 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
 
         :param value:
         """
+        em_metadata = self.metadata["EM Dataset"]
+
         if not values:
-            self.metadata["EM Dataset"]["Property groups"] = []
+            em_metadata["Property groups"] = []
             return
 
         if not isinstance(values, list):
@@ -554,6 +676,7 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
             if self.property_groups
             else {}
         )
+        group_entities = set(groups.values())
 
         for value in values:
             if self.property_groups is None:
@@ -565,7 +688,7 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
                     "name of an existing PropertyGroup."
                 )
 
-            if not (value in groups or value in groups.values()):
+            if not (value in groups or value in group_entities):
                 raise ValueError("Property group must be an existing PropertyGroup.")
 
             if isinstance(value, str):
@@ -579,8 +702,8 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
                     + "differ from the number of 'channels'."
                 )
 
-            if value.name not in self.metadata["EM Dataset"]["Property groups"]:
-                self.metadata["EM Dataset"]["Property groups"].append(value.name)
+            if value.name not in em_metadata["Property groups"]:
+                em_metadata["Property groups"].append(value.name)
 
     def _super_copy(
         self,
@@ -652,97 +775,91 @@ class LargeLoopGroundEMSurvey(BaseEMSurvey, Curve):
         clear_cache: bool = False,
         mask: np.ndarray | None = None,
     ):
+        is_receiver = isinstance(self, self.default_receiver_type)
+        tx_id_property = self.tx_id_property
+
         if (
             self.cells is not None
             and new_entity.tx_id_property is None
-            and self.tx_id_property is not None
-            and self.tx_id_property.values is not None
+            and tx_id_property is not None
+            and tx_id_property.values is not None
         ):
             if mask is not None:
-                if isinstance(self, self.default_receiver_type):
+                if is_receiver:
                     cell_mask = mask
                 else:
                     cell_mask = np.all(mask[self.cells], axis=1)
             else:
-                cell_mask = np.ones(self.tx_id_property.values.shape[0], dtype=bool)
+                cell_mask = np.ones(tx_id_property.values.shape[0], dtype=bool)
+
+            new_entity.tx_id_property = tx_id_property.values[cell_mask]
 
-            new_entity.tx_id_property = self.tx_id_property.values[cell_mask]
+        # Fast path: single-loop surveys carry no transmitter IDs.
+        complement = self.complement
+        if complement is None or new_entity.tx_id_property is None:
+            return None
 
-        if not (
-            new_entity.tx_id_property is not None
-            and self.complement is not None
-            and self.complement.tx_id_property is not None
-            and self.complement.tx_id_property.values is not None
-            and self.complement.vertices is not None
-            and self.complement.cells is not None
+        if (
+            complement.tx_id_property is None
+            or complement.tx_id_property.values is None
+            or complement.vertices is None
+            or complement.cells is None
         ):
             return None
 
-        intersect = np.intersect1d(
+        complement_values = complement.tx_id_property.values
+        intersect = _sorted_intersect(
             new_entity.tx_id_property.values,
-            self.complement.tx_id_property.values,
+            complement_values,
         )
 
         # Convert cell indices to vertex indices
-        if isinstance(
-            self.complement,
-            self.default_receiver_type,
-        ):
-            mask = np.r_[
-                [(val in intersect) for val in self.complement.tx_id_property.values]
-            ]
-            tx_ids = self.complement.tx_id_property.values[mask]
+        if isinstance(complement, self.default_receiver_type):
+            mask = _isin_sorted(intersect, complement_values)
+            tx_ids = complement_values[mask]
         else:
-            cell_mask = np.r_[
-                [(val in intersect) for val in self.complement.tx_id_property.values]
-            ]
-            mask = np.zeros(self.complement.vertices.shape[0], dtype=bool)
-            mask[self.complement.cells[cell_mask, :]] = True
-            tx_ids = self.complement.tx_id_property.values[cell_mask]
+            cell_mask = _isin_sorted(intersect, complement_values)
+            mask = np.zeros(complement.vertices.shape[0], dtype=bool)
+            mask[np.unique(complement.cells[cell_mask])] = True
+            tx_ids = complement_values[cell_mask]
 
-        new_complement = (
-            self.complement._super_copy(  # pylint: disable=protected-access
-                parent=parent,
-                omit_list=OMIT_LIST,
-                copy_children=copy_children,
-                clear_cache=clear_cache,
-                mask=mask,
-            )
+        new_complement = complement._super_copy(  # pylint: disable=protected-access
+            parent=parent,
+            omit_list=OMIT_LIST,
+            copy_children=copy_children,
+            clear_cache=clear_cache,
+            mask=mask,
         )
 
-        if isinstance(self, self.default_receiver_type):
+        if is_receiver:
             new_entity.transmitters = new_complement
         else:
             new_entity.receivers = new_complement
 
-        if (
-            new_complement.tx_id_property is None
-            and self.complement.tx_id_property is not None
-        ):
+        if new_complement.tx_id_property is None:
             new_complement.tx_id_property = tx_ids
-
-            # Re-number the tx_id_property
-            value_map = {
-                val: ind
-                for ind, val in enumerate(
-                    np.r_[0, np.unique(new_entity.transmitters.tx_id_property.values)]
-                )
-            }
-            new_map = {
-                val: new_entity.transmitters.tx_id_property.value_map.map[ind]
-                for ind, val in value_map.items()
-            }
-            new_complement.tx_id_property.values = np.asarray(
-                [value_map[val] for val in new_complement.tx_id_property.values]
-            )
-            new_complement.tx_id_property.entity_type.value_map = new_map
-            new_entity.tx_id_property.values = np.asarray(
-                [value_map[val] for val in new_entity.tx_id_property.values]
-            )
-            new_entity.tx_id_property.entity_type.value_map = new_map
+            self._renumber_tx_ids(new_entity, new_complement)
 
         return new_complement
 
+    @staticmethod
+    def _renumber_tx_ids(new_entity, new_complement):
+        """
+        Re-number the tx_id_property of a copied survey pair to a dense
+        range and rebuild the shared value map accordingly.
+        """
+        uniques = np.r_[0, np.unique(new_entity.transmitters.tx_id_property.values)]
+        old_map = new_entity.transmitters.tx_id_property.value_map.map
+        new_map = {ind: old_map[val] for ind, val in enumerate(uniques)}
+        new_complement.tx_id_property.values = _remap_ids(
+            new_complement.tx_id_property.values, uniques
+        )
+        new_complement.tx_id_property.entity_type.value_map = new_map
+        new_entity.tx_id_property.values = _remap_ids(
+            new_entity.tx_id_property.values, uniques
+        )
+        new_entity.tx_id_property.entity_type.value_map = new_map
+
     @property
     def default_input_types(self) -> list[str]:
         """Choice of survey creation types."""
@@ -755,8 +872,13 @@ class LargeLoopGroundEMSurvey(BaseEMSurvey, Curve):
         """
         if self._tx_id_property is None:
             data = self.get_data("Transmitter ID")
-            if any(data) and isinstance(data[0], ReferencedData):
+            if data and isinstance(data[0], ReferencedData):
                 self._tx_id_property = data[0]
+            else:
+                self._tx_id_property = _TX_ID_ABSENT
+
+        if self._tx_id_property is _TX_ID_ABSENT:
+            return None
 
         return self._tx_id_property
 
@@ -773,7 +895,8 @@ class LargeLoopGroundEMSurvey(BaseEMSurvey, Curve):
                 entity_type = self.complement.tx_id_property.entity_type
             else:
                 value_map = {
-                    ind: f"Loop {ind}" for ind in np.unique(value.astype(np.int32))
+                    ind: f"Loop {ind}"
+                    for ind in np.unique(value).astype(np.int32, copy=False)
                 }
                 value_map[0] = "Unknown"
                 entity_type = {  # type: ignore
@@ -835,11 +958,10 @@ class AirborneEMSurvey(BaseEMSurvey, Curve):
         Fetch entry from the metadata.
         """
         field = self._PROPERTY_MAP.get(key, "")
-        if field + " value" in self.metadata["EM Dataset"]:
-            return self.metadata["EM Dataset"][field + " value"]
-        if field + " property" in self.metadata["EM Dataset"]:
-            return self.metadata["EM Dataset"][field + " property"]
-        return None
+        em_metadata = self.metadata["EM Dataset"]
+        if field + " value" in em_metadata:
+            return em_metadata[field + " value"]
+        return em_metadata.get(field + " property")
 
     def set_metadata(self, key: str, value: float | uuid.UUID | None):
         if key not in self._PROPERTY_MAP:
@@ -983,14 +1105,8 @@ class TEMSurvey(BaseEMSurvey):
         Generally used as the reference (time=0.0) for the provided
         (-) on-time an (+) off-time :attr:`channels`.
         """
-        if (
-            "Waveform" in self.metadata["EM Dataset"]
-            and "Timing mark" in self.metadata["EM Dataset"]["Waveform"]
-        ):
-            timing_mark = self.metadata["EM Dataset"]["Waveform"]["Timing mark"]
-            return timing_mark
-
-        return None
+        waveform = self.metadata["EM Dataset"].get("Waveform", {})
+        return waveform.get("Timing mark")
 
     @timing_mark.setter
     def timing_mark(self, timing_mark: float | None):
@@ -1024,17 +1140,11 @@ class TEMSurvey(BaseEMSurvey):
             ]
 
         """
-        if (
-            "Waveform" in self.metadata["EM Dataset"]
-            and "Discretization" in self.metadata["EM Dataset"]["Waveform"]
-        ):
-            waveform = np.vstack(
-                [
-                    [row["time"], row["current"]]
-                    for row in self.metadata["EM Dataset"]["Waveform"]["Discretization"]
-                ]
-            )
-            return waveform
+        discretization = (
+            self.metadata["EM Dataset"].get("Waveform", {}).get("Discretization")
+        )
+        if discretization is not None:
+            return np.vstack([[row["time"], row["current"]] for row in discretization])
         return None
 
     @waveform.setter
@@ -19,6 +19,8 @@
 
 from __future__ import annotations
 
+import os
+import sys
 import uuid
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
@@ -34,11 +36,66 @@ if TYPE_CHECKING:
 DEFAULT_CRS = {"Code": "Unknown", "Name": "Unknown"}
 
 
+class _UuidPool:
+    """
+    Pooled source of random (version 4) UUIDs.
+
+    Equivalent to :func:`uuid.uuid4`, but amortizes the cost of
+    :func:`os.urandom` over many entities by pulling random bytes in
+    large blocks and slicing 16-byte windows.
+    """
+
+    __slots__ = ("_offset", "_pool")
+
+    _BLOCK_SIZE = 4096
+
+    def __init__(self):
+        self._pool = b""
+        self._offset = 0
+
+    def next_uuid(self) -> uuid.UUID:
+        if self._offset + 16 > len(self._pool):
+            self._pool = os.urandom(self._BLOCK_SIZE)
+            self._offset = 0
+
+        block = bytearray(self._pool[self._offset : self._offset + 16])
+        self._offset += 16
+
+        # Set the version (4) and variant (RFC 4122) bits
+        block[6] = (block[6] & 0x0F) | 0x40
+        block[8] = (block[8] & 0x3F) | 0x80
+
+        return uuid.UUID(bytes=bytes(block))
+
+
+_UUID_POOL = _UuidPool()
+
+
+def _next_uuid() -> uuid.UUID:
+    """Generate a random UUID from the module's pooled random source."""
+    return _UUID_POOL.next_uuid()
+
+
 class Entity(ABC):
     """
     Base Entity class
     """
 
+    __slots__ = (
+        "_allow_delete",
+        "_allow_move",
+        "_allow_rename",
+        "_clipping_ids",
+        "_metadata",
+        "_name",
+        "_on_file",
+        "_parent",
+        "_partially_hidden",
+        "_public",
+        "_uid",
+        "_visible",
+    )
+
     _attribute_map: dict = {
         "Allow delete": "allow_delete",
         "Allow move": "allow_move",
@@ -50,11 +107,11 @@ class Entity(ABC):
         "Public": "public",
         "Visible": "visible",
     }
-    _visible = True
+    _default_visible = True
 
     def __init__(self, uid: uuid.UUID | None = None, name="Entity", **kwargs):
         self._uid = (
-            str2uuid(uid) if isinstance(str2uuid(uid), uuid.UUID) else uuid.uuid4()
+            str2uuid(uid) if isinstance(str2uuid(uid), uuid.UUID) else _next_uuid()
         )
 
         self._allow_delete = True
@@ -67,6 +124,7 @@ class Entity(ABC):
         self._parent: Entity | None = None
         self._partially_hidden = False
         self._public = True
+        self._visible = self._default_visible
 
         map_attributes(self, **kwargs)
 
@@ -192,6 +250,11 @@ class Entity(ABC):
         """
         # TODO: implement an actual fixup
         #  (possibly it has to be abstract with different implementations per Entity type)
+        if isinstance(name, str):
+            # Repeated names (components, channels) are common across large
+            # workspaces; interning dedupes the strings in memory.
+            return sys.intern(name)
+
         return name
 
     @abstractmethod
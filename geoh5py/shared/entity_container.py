@@ -27,7 +27,6 @@ from warnings import warn
 
 import numpy as np
 
-from ..shared.utils import str2uuid
 from .entity import Entity
 
 if TYPE_CHECKING:
@@ -43,9 +42,6 @@ class EntityContainer(Entity):
     """
 
     def __init__(self, uid: uuid.UUID | None = None, name="Entity", **kwargs):
-        self._uid = (
-            str2uuid(uid) if isinstance(str2uuid(uid), uuid.UUID) else uuid.uuid4()
-        )
         self._children: list = []
 
         super().__init__(uid, name, **kwargs)
@@ -62,7 +58,16 @@ class EntityContainer(Entity):
         with open(file, "rb") as raw_binary:
             blob = raw_binary.read()
 
-        name = Path(file).name
+        return self.add_file_bytes(blob, Path(file).name)
+
+    def add_file_bytes(self, blob: bytes, name: str):
+        """
+        Add in-memory file content to the object or group stored as bytes
+        on a FilenameData.
+
+        :param blob: Binary content of the file.
+        :param name: Name given to the file entity.
+        """
         attributes = {
             "name": name,
             "file_name": name,
@@ -221,5 +226,8 @@ class EntityContainer(Entity):
         if not isinstance(children, list):
             children = [children]
 
-        self._children = [child for child in self._children if child not in children]
+        removed_uids = {child.uid for child in children}
+        self._children = [
+            child for child in self._children if child.uid not in removed_uids
+        ]
         self.workspace.remove_children(self, children)
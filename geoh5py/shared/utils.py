@@ -239,6 +239,26 @@ def clear_array_attributes(entity: Entity, recursive: bool = False):
             clear_array_attributes(child, recursive=recursive)
 
 
+def instance_attributes(entity) -> dict:
+    """
+    Get the instance attributes of an object, whether stored in
+    ``__dict__`` or in ``__slots__`` declared along its class hierarchy.
+
+    :param entity: Target object.
+
+    :return: Dictionary of attribute names and values.
+    """
+    attributes = {}
+    for cls in reversed(type(entity).__mro__):
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(entity, name):
+                attributes[name] = getattr(entity, name)
+
+    attributes.update(getattr(entity, "__dict__", {}))
+
+    return attributes
+
+
 def are_objects_similar(obj1, obj2, ignore: list[str] | None):
     """
     Compare two objects to see if they are similar. This is a shallow comparison.
@@ -306,16 +326,31 @@ def compare_bytes(object_a, object_b):
 
 
 def compare_entities(
-    object_a, object_b, ignore: list[str] | None = None, decimal: int = 6
+    object_a,
+    object_b,
+    ignore: list[str] | None = None,
+    decimal: int = 6,
+    include: list[str] | None = None,
 ) -> None:
     if isinstance(object_a, bytes):
         compare_bytes(object_a, object_b)
         return
 
-    base_ignore = ["_workspace", "_children", "_visual_parameters", "_entity_class"]
+    base_ignore = [
+        "_workspace",
+        "_children",
+        "_visual_parameters",
+        "_entity_class",
+        "_image",
+    ]
     ignore_list = base_ignore + ignore if ignore else base_ignore
 
-    for attr in [k for k in object_a.__dict__.keys() if k not in ignore_list]:
+    if include is not None:
+        attributes = [attr if attr[0] == "_" else "_" + attr for attr in include]
+    else:
+        attributes = [k for k in instance_attributes(object_a) if k not in ignore_list]
+
+    for attr in attributes:
         if isinstance(getattr(object_a, attr[1:]), ABC):
             compare_entities(
                 getattr(object_a, attr[1:]),
@@ -413,9 +448,12 @@ def str2uuid(value: Any) -> UUID | Any:
     if isinstance(value, bytes):
         value = value.decode("utf-8")
 
-    if is_uuid(value):
-        # TODO insert validation
-        return UUID(str(value))
+    if isinstance(value, str):
+        try:
+            return UUID(value)
+        except ValueError:
+            return value
+
     return value
 
 
@@ -555,7 +593,7 @@ def get_attributes(entity, omit_list=(), attributes=None):
     """Extract the attributes of an object with omissions."""
     if attributes is None:
         attributes = {}
-    for key in vars(entity):
+    for key in instance_attributes(entity):
         if key not in omit_list:
             if key[0] == "_":
                 key = key[1:]
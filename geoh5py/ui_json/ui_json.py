@@ -43,6 +43,7 @@ class UIJson:
 
     def __init__(self, parameters: dict[str, Parameter | FormParameter]):
         self.__dict__["parameters"] = parameters
+        self.__dict__["_dict_cache"] = {}
         self._validations = SetDict()
         self.enforcers: EnforcerPool = EnforcerPool.from_validations(
             self.name, self.validations
@@ -75,16 +76,19 @@ class UIJson:
             camel case for writing to file.
         """
 
-        use_camel = naming == "camel"
-
-        def get_data(param: Parameter | FormParameter):
-            return param.form(use_camel) if hasattr(param, "form") else param.value
-
-        out = {}
-        for param, value in self.parameters.items():
-            out[param] = get_data(value)
+        cache = self.__dict__["_dict_cache"]
+        if naming not in cache:
+            use_camel = naming == "camel"
+            cache[naming] = {
+                name: (
+                    param.form(use_camel)
+                    if isinstance(param, FormParameter)
+                    else param.value
+                )
+                for name, param in self.parameters.items()
+            }
 
-        return out
+        return dict(cache[naming])
 
     def update(self, data: dict[str, Any]):
         for param, value in data.items():
@@ -92,6 +96,7 @@ class UIJson:
                 self.update_state(param, value)
                 self.update_data(param, value)
             else:
+                self.__dict__["_dict_cache"].clear()
                 self.parameters[param] = value
 
         self.enforcers = EnforcerPool.from_validations(self.name, self.validations)
@@ -99,6 +104,7 @@ class UIJson:
     def update_state(self, param: str, value: Any):
         """Updates the member values of all FormParameter objects."""
 
+        self.__dict__["_dict_cache"].clear()
         if isinstance(value, dict):
             if not isinstance(self.parameters[param], FormParameter):
                 msg = (
@@ -112,6 +118,7 @@ class UIJson:
 
     def update_data(self, param: str, value: Any):
         """Updates the values of all FormParameter / Parameter objects."""
+        self.__dict__["_dict_cache"].clear()
         if isinstance(value, dict) and "value" in value:
             self.parameters[param].value = value["value"]
         else:
@@ -141,6 +148,7 @@ class UIJson:
 
     def __setattr__(self, name: str, value: Any):
         if name in self.__dict__["parameters"]:
+            self.__dict__["_dict_cache"].clear()
             self.__dict__["parameters"][name].value = value
         else:
             self.__dict__[name] = value
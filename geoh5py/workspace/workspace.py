@@ -111,6 +111,7 @@ class Workspace(AbstractContextManager):
         version: float = 2.1,
     ):
         self._data: dict[uuid.UUID, ReferenceType[data.Data]] = {}
+        self._deferred_writes: dict | None = None
         self._distance_unit: str = distance_unit
         self._contributors: np.ndarray = np.asarray(
             contributors, dtype=h5py.special_dtype(vlen=str)
@@ -255,6 +256,7 @@ class Workspace(AbstractContextManager):
                 "_on_file",
                 "_centroids",
                 "_extent",
+                "_image",
                 "_visual_parameters",
             ]
             + list(omit_list),
@@ -1359,6 +1361,29 @@ class Workspace(AbstractContextManager):
         """Get all active entity types registered in the workspace."""
         return self._all_types()
 
+    @contextmanager
+    def defer_writes(self):
+        """
+        Context manager deferring :func:`update_attribute` writes to geoh5.
+
+        Within the context, updates are collected and de-duplicated per
+        (entity, attribute) pair instead of written immediately. Pending
+        updates are flushed on exit, so repeated edits of the same
+        attribute trigger a single write. Nested contexts merge into the
+        outermost one.
+        """
+        if self._deferred_writes is not None:
+            yield
+            return
+
+        self._deferred_writes = {}
+        try:
+            yield
+        finally:
+            deferred, self._deferred_writes = self._deferred_writes, None
+            for (entity, attribute, channel), kwargs in deferred.items():
+                self.update_attribute(entity, attribute, channel=channel, **kwargs)
+
     def update_attribute(
         self,
         entity: Entity | EntityType,
@@ -1373,6 +1398,10 @@ class Workspace(AbstractContextManager):
         :param attribute: Name of the attribute to get updated to geoh5.
         :param channel: Optional channel argument for concatenated data and index.
         """
+        if self._deferred_writes is not None and not isinstance(entity, Concatenated):
+            self._deferred_writes[(entity, attribute, channel)] = kwargs
+            return
+
         if entity.on_file:
             if isinstance(entity, Concatenated):
                 entity.concatenator.update_attributes(entity, attribute)
@@ -0,0 +1,94 @@
+#  Copyright (c) 2024 Mira Geoscience Ltd.
+#
+#  This file is part of geoh5py.
+#
+#  geoh5py is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  geoh5py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from geoh5py.objects import Points
+from geoh5py.workspace import Workspace
+
+
+def test_defer_writes_deduplicates(tmp_path: Path):
+    # pylint: disable=protected-access
+    h5file_path = tmp_path / r"testDeferWrites.geoh5"
+    xyz = np.random.randn(12, 3)
+
+    with Workspace.create(h5file_path) as workspace:
+        points = Points.create(workspace, vertices=xyz)
+
+        with workspace.defer_writes():
+            points.name = "first name"
+            points.public = False
+            points.name = "final name"
+
+            # Repeated edits of the same attribute collapse to a single
+            # pending write per (entity, attribute) pair.
+            assert workspace._deferred_writes is not None
+            assert list(workspace._deferred_writes) == [(points, "attributes", None)]
+
+        # Pending writes are flushed on exit
+        assert workspace._deferred_writes is None
+
+    with Workspace(h5file_path) as workspace:
+        rec_obj = workspace.get_entity("final name")[0]
+        assert rec_obj is not None, "Deferred write was not flushed to file."
+        assert not rec_obj.public
+
+
+def test_defer_writes_nested(tmp_path: Path):
+    # pylint: disable=protected-access
+    h5file_path = tmp_path / r"testDeferWritesNested.geoh5"
+    xyz = np.random.randn(12, 3)
+
+    with Workspace.create(h5file_path) as workspace:
+        points = Points.create(workspace, vertices=xyz)
+
+        with workspace.defer_writes():
+            with workspace.defer_writes():
+                points.name = "nested name"
+
+            # Inner context merges into the outer one: still deferred
+            assert workspace._deferred_writes
+            assert (points, "attributes", None) in workspace._deferred_writes
+
+        assert workspace._deferred_writes is None
+
+    with Workspace(h5file_path) as workspace:
+        assert workspace.get_entity("nested name")[0] is not None
+
+
+def test_defer_writes_flushes_on_error(tmp_path: Path):
+    # pylint: disable=protected-access
+    h5file_path = tmp_path / r"testDeferWritesError.geoh5"
+    xyz = np.random.randn(12, 3)
+
+    with Workspace.create(h5file_path) as workspace:
+        points = Points.create(workspace, vertices=xyz)
+
+        with pytest.raises(RuntimeError, match="Oops"):
+            with workspace.defer_writes():
+                points.name = "renamed before error"
+                raise RuntimeError("Oops")
+
+        assert workspace._deferred_writes is None
+
+    with Workspace(h5file_path) as workspace:
+        assert workspace.get_entity("renamed before error")[0] is not None
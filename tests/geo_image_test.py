@@ -199,9 +199,9 @@ def test_georeference_image(tmp_path):
         image = Image.fromarray(
             np.random.randint(0, 255, (128, 128, 3)).astype("uint8"), "RGB"
         )
-        for id_ in tag.items():
-            image.getexif()[id_[0]] = id_[1]
-        image.save(tmp_path / r"testtif.tif", exif=image.getexif())
+        exif = image.getexif()
+        exif.update(tag)
+        image.save(tmp_path / r"testtif.tif", exif=exif)
 
         # load image
         geoimage = GeoImage.create(
@@ -222,9 +222,10 @@ def test_georeference_image(tmp_path):
         ):
             geoimage.georeferencing_from_tiff()
 
-        image = Image.open(f"{str(tmp_path)}/testtif.tif")
+        tif_image = Image.open(f"{str(tmp_path)}/testtif.tif")
+        tif_image.load()
 
-        geoimage = GeoImage.create(workspace, name="test_area", image=image)
+        geoimage = GeoImage.create(workspace, name="test_area", image=tif_image)
 
         # create Gray grid2d
         grid2d_gray = geoimage.to_grid2d(mode="GRAY")
@@ -269,7 +270,7 @@ def test_georeference_image(tmp_path):
 
         geoimage.save_as("saved_tif.png", str(tmp_path))
 
-        image = Image.open(f"{str(tmp_path)}/testtif.tif").convert("L")
+        image = tif_image.convert("L")
         geoimage = GeoImage.create(workspace, name="test_area", image=image)
 
         image = Image.fromarray(
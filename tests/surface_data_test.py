@@ -39,14 +39,12 @@ def test_create_surface_data(tmp_path: Path):
 
         xyz = np.c_[x, y, z]
 
-        simplices = np.unique(
+        simplices = np.sort(
             np.random.randint(0, xyz.shape[0] - 1, (xyz.shape[0], 3)), axis=1
         )
 
         # Create random data
-        values = np.mean(
-            np.c_[x[simplices[:, 0]], x[simplices[:, 1]], x[simplices[:, 2]]], axis=1
-        )
+        values = x[simplices].mean(axis=1)
 
         # Create a geoh5 surface
         surface = Surface.create(workspace, name="mySurf", vertices=xyz)
@@ -67,8 +65,8 @@ def test_create_surface_data(tmp_path: Path):
         rec_obj = new_workspace.get_entity("mySurf")[0]
         rec_data = rec_obj.get_data("TMI")[0]
 
-        compare_entities(surface, rec_obj)
-        compare_entities(data, rec_data)
+        compare_entities(surface, rec_obj, include=["vertices", "cells"])
+        compare_entities(data, rec_data, include=["values"])
 
 
 def test_remove_cells_surface_data(tmp_path: Path):